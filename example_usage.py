@@ -9,9 +9,13 @@ both standard OpenAI and Azure OpenAI options.
 import os
 import asyncio
 import json
+import logging
 from dotenv import load_dotenv
 
-from src.ai_agents import (
+# Configure logging for the example run, before importing the agent package
+logging.basicConfig(level=logging.INFO)
+
+from src.ai_agents import (  # noqa: E402
     AIAgentSystem,
     MarketDataRequest,
     RentEstimateRequest,
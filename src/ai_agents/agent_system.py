@@ -7,7 +7,7 @@ This module integrates all AI agent components: orchestrator, specialized agents
 import logging
 import asyncio
 import os
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List
 
 from agents import Agent, Runner
 
@@ -19,11 +19,8 @@ from .specialized import (
     create_optimization_agent
 )
 from .guardrails import create_guardrails
-from openai import AsyncAzureOpenAI
-from agents import set_default_openai_client
+from .client import get_openai_client
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Monkey patch Agent class to add guardrails attribute if it doesn't exist
@@ -116,16 +113,8 @@ class AIAgentSystem:
                 )
             os.environ["OPENAI_API_KEY"] = os.environ.get("AZURE_OPENAI_API_KEY")
 
-        # Create OpenAI client using Azure OpenAI
-        openai_client = AsyncAzureOpenAI(
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-            api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
-        )
-
-        # Set the default OpenAI client for the Agents SDK
-        set_default_openai_client(openai_client)
+        # Use the shared, pooled Azure OpenAI client (also registered as the SDK default)
+        get_openai_client()
         
         # When using Azure, the model_name should be the deployment name
         self.model_name = self.azure_deployment
@@ -259,4 +248,27 @@ class AIAgentSystem:
             agent_type,
             input_text,
             model=self.model_name
-        )
\ No newline at end of file
+        )
+    
+    async def stream_direct_task(self, agent_type: str, input_text: str) -> AsyncIterator[str]:
+        """
+        Execute a task directly with a specific specialized agent, streaming its output.
+        
+        Args:
+            agent_type: Type of specialized agent to use
+            input_text: Input text for the agent
+            
+        Yields:
+            Incremental chunks of the agent's output text
+            
+        Raises:
+            ValueError: If the system is not initialized or agent_type is unknown
+            RuntimeError: If the agent run fails before or during streaming
+        """
+        if not self.orchestrator:
+            raise ValueError("AI agent system not initialized. Call initialize() first.")
+        
+        logger.info(f"Streaming direct task with {agent_type} agent")
+        
+        async for chunk in self.orchestrator.stream_task(agent_type, input_text):
+            yield chunk
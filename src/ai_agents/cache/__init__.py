@@ -0,0 +1,11 @@
+"""
+Response caching for AI agents in the Property Investment Analysis Application.
+"""
+
+from .response_cache import DEFAULT_TTL, ResponseCache, make_cache_key
+
+__all__ = [
+    "DEFAULT_TTL",
+    "ResponseCache",
+    "make_cache_key"
+]
@@ -0,0 +1,85 @@
+"""
+In-process response cache for AI agents in the Property Investment Analysis Application.
+
+This module implements an exact-match cache so identical agent inputs can skip
+repeated processing and LLM calls.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default lifetime of cached agent results, in seconds
+DEFAULT_TTL = 3600.0
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a stable cache key from arbitrary JSON-serializable inputs.
+    
+    Args:
+        parts: Values identifying the request (strings, dicts, lists, ...)
+        
+    Returns:
+        Hex-encoded SHA-256 digest of the canonicalized inputs
+    """
+    canonical = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class ResponseCache:
+    """
+    Bounded, thread-safe LRU cache with an optional time-to-live.
+    
+    Only successful results should be stored; callers are expected to call
+    set() after the wrapped work completes without raising.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept before evicting the least recently used
+            ttl: Optional lifetime of an entry in seconds (None keeps entries until evicted)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,98 @@
+"""
+Shared Azure OpenAI client for the Property Investment Analysis Application.
+
+All agent factories use the same clients, and all clients share one HTTP connection
+pool instead of opening a new TCP/TLS pool per agent.
+"""
+
+import functools
+import logging
+import os
+from typing import Tuple
+
+import httpx
+from agents import set_default_openai_client
+from dotenv import load_dotenv
+from openai import AsyncAzureOpenAI, DefaultAsyncHttpxClient
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits for the shared HTTP client
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+HTTP_TIMEOUT = 60.0
+
+# Model used when no mini deployment is configured
+DEFAULT_MODEL = "gpt-4o"
+
+@functools.lru_cache(maxsize=1)
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP connection pool shared by all Azure OpenAI clients."""
+    return DefaultAsyncHttpxClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+@functools.lru_cache(maxsize=None)
+def _get_deployment_client(azure_deployment: str) -> AsyncAzureOpenAI:
+    """
+    Get a client whose requests are routed to a specific Azure OpenAI deployment.
+    
+    Args:
+        azure_deployment: Name of the Azure OpenAI deployment
+        
+    Returns:
+        AsyncAzureOpenAI client for that deployment, using the shared connection pool
+    """
+    return AsyncAzureOpenAI(
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+        azure_deployment=azure_deployment,
+        http_client=_get_http_client(),
+    )
+
+@functools.lru_cache(maxsize=1)
+def get_openai_client() -> AsyncAzureOpenAI:
+    """
+    Get the process-wide Azure OpenAI client.
+    
+    The client is created on first use from the AZURE_OPENAI_* environment variables
+    and registered as the default client for the Agents SDK.
+    
+    Returns:
+        Shared AsyncAzureOpenAI client
+    """
+    # Load environment variables
+    load_dotenv()
+    
+    # Create OpenAI client using Azure OpenAI with a shared connection pool
+    openai_client = AsyncAzureOpenAI(
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+        azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
+        http_client=_get_http_client(),
+    )
+    
+    # Set the default OpenAI client for the Agents SDK
+    set_default_openai_client(openai_client)
+    logger.info("Shared Azure OpenAI client configured for agents")
+    
+    return openai_client
+
+def get_light_model_client() -> Tuple[AsyncAzureOpenAI, str]:
+    """
+    Get the client and model name for lightweight structured-extraction agents.
+    
+    The Azure client puts the deployment in the request URL and ignores the model
+    name, so a smaller model needs its own deployment. When
+    AZURE_OPENAI_MINI_DEPLOYMENT_NAME is set (e.g. a gpt-4o-mini deployment),
+    requests are routed there; otherwise the shared default deployment is used.
+    
+    Returns:
+        Tuple of (client, model name) to pass to OpenAIChatCompletionsModel
+    """
+    default_client = get_openai_client()
+    
+    mini_deployment = os.getenv("AZURE_OPENAI_MINI_DEPLOYMENT_NAME")
+    if not mini_deployment:
+        return default_client, DEFAULT_MODEL
+    
+    return _get_deployment_client(mini_deployment), mini_deployment
@@ -12,10 +12,35 @@ from pydantic import BaseModel
 
 from agents import Agent, GuardrailFunctionOutput, RunContextWrapper, TResponseInputItem
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Investment-related keywords for the relevance check, stored pre-lowercased
+INVESTMENT_KEYWORDS = tuple(keyword.lower() for keyword in (
+    "property", "invest", "apartment", "house", "real estate", "mortgage",
+    "rent", "buy", "price", "market", "loan", "finance", "cash flow",
+    "closing cost", "ROI", "return", "rental", "tax", "depreciation"
+))
+
+# Prompt injection patterns for the safety check, compiled once at import
+INJECTION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"ignore previous instructions",
+    r"disregard .*instructions",
+    r"forget .*instructions",
+    r"your instructions are",
+    r"your prompt is",
+    r"you are actually",
+    r"system prompt"
+))
+
+# Common PII patterns for the PII filter, compiled once at import
+PII_PATTERNS = {
+    "email": re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE),
+    "phone_number": re.compile(r'\b(?:\+?\d{1,3}[- ]?)?\(?\d{3}\)?[- ]?\d{3}[- ]?\d{4}\b', re.IGNORECASE),
+    "social_security": re.compile(r'\b\d{3}[-]?\d{2}[-]?\d{4}\b', re.IGNORECASE),
+    "credit_card": re.compile(r'\b(?:\d{4}[- ]?){3}\d{4}\b', re.IGNORECASE),
+    "address": re.compile(r'\b\d+\s+[A-Za-z]+\s+(?:St|Street|Ave|Avenue|Blvd|Boulevard|Rd|Road|Drive|Dr)[.,]?\b', re.IGNORECASE)
+}
+
 class RelevanceCheckResult(BaseModel):
     """Result of a relevance check on user input."""
     is_relevant: bool
@@ -61,15 +86,9 @@ async def relevance_check_guardrail(
     """
     input_text = " ".join([item.content for item in input if hasattr(item, 'content')])
     
-    # First perform a simple keyword-based check
-    investment_keywords = [
-        "property", "invest", "apartment", "house", "real estate", "mortgage", 
-        "rent", "buy", "price", "market", "loan", "finance", "cash flow", 
-        "closing cost", "ROI", "return", "rental", "tax", "depreciation"
-    ]
-    
-    # Check if input contains any investment-related keywords
-    contains_keywords = any(keyword.lower() in input_text.lower() for keyword in investment_keywords)
+    # First perform a simple keyword-based check, lowercasing the input only once
+    input_lower = input_text.lower()
+    contains_keywords = any(keyword in input_lower for keyword in INVESTMENT_KEYWORDS)
     
     # Perform more advanced analysis if needed
     # In production, this would use a classification model
@@ -116,18 +135,8 @@ async def safety_check_guardrail(
     input_text = " ".join([item.content for item in input if hasattr(item, 'content')])
     
     # Check for potential prompt injection patterns
-    injection_patterns = [
-        r"ignore previous instructions",
-        r"disregard .*instructions",
-        r"forget .*instructions",
-        r"your instructions are",
-        r"your prompt is",
-        r"you are actually",
-        r"system prompt"
-    ]
-    
-    for pattern in injection_patterns:
-        if re.search(pattern, input_text, re.IGNORECASE):
+    for pattern in INJECTION_PATTERNS:
+        if pattern.search(input_text):
             result = SafetyCheckResult(
                 is_safe=False,
                 reasoning=f"Potential prompt injection attempt detected",
@@ -176,22 +185,14 @@ async def pii_filter_guardrail(
     input_text = " ".join([item.content for item in input if hasattr(item, 'content')])
     
     # Check for common PII patterns
-    pii_patterns = {
-        "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-        "phone_number": r'\b(?:\+?\d{1,3}[- ]?)?\(?\d{3}\)?[- ]?\d{3}[- ]?\d{4}\b',
-        "social_security": r'\b\d{3}[-]?\d{2}[-]?\d{4}\b',
-        "credit_card": r'\b(?:\d{4}[- ]?){3}\d{4}\b',
-        "address": r'\b\d+\s+[A-Za-z]+\s+(?:St|Street|Ave|Avenue|Blvd|Boulevard|Rd|Road|Drive|Dr)[.,]?\b'
-    }
-    
     found_pii = []
     redacted_text = input_text
     
-    for pii_type, pattern in pii_patterns.items():
-        if re.search(pattern, input_text, re.IGNORECASE):
+    for pii_type, pattern in PII_PATTERNS.items():
+        if pattern.search(input_text):
             found_pii.append(pii_type)
             # Redact PII in the text
-            redacted_text = re.sub(pattern, f"[REDACTED {pii_type.upper()}]", redacted_text, flags=re.IGNORECASE)
+            redacted_text = pattern.sub(f"[REDACTED {pii_type.upper()}]", redacted_text)
     
     if found_pii:
         result = PIICheckResult(
@@ -12,8 +12,8 @@ import json
 from agents import Agent, function_tool, OpenAIChatCompletionsModel
 from pydantic import BaseModel
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from ..client import get_openai_client
+
 logger = logging.getLogger(__name__)
 
 class ManagerAgentResult(BaseModel):
@@ -75,23 +75,8 @@ def create_manager_agent(specialized_agents: Dict[str, Agent], model: str = "gpt
     limitations and suggest alternative approaches.
     """
     
-    from openai import AsyncAzureOpenAI
-    from agents import set_default_openai_client
-    from dotenv import load_dotenv
-    import os
-
-    # Load environment variables
-    load_dotenv()
-    # Create OpenAI client using Azure OpenAI
-    openai_client = AsyncAzureOpenAI(
-        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-        api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
-        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-        azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
-    )
-
-    # Set the default OpenAI client for the Agents SDK
-    set_default_openai_client(openai_client)
+    # Use the shared Azure OpenAI client
+    openai_client = get_openai_client()
 
     # Create and return the agent
     return Agent(
@@ -104,12 +89,14 @@ def create_manager_agent(specialized_agents: Dict[str, Agent], model: str = "gpt
         ),
     )
 
+# Tool descriptions for each specialized agent type
+AGENT_DESCRIPTIONS = {
+    "market_data": "gather current market data for a specific location including prices, rents, and trends",
+    "rent_estimation": "estimate potential rental income based on property specifics and local market data",
+    "document_analysis": "extract key information from property documents like leases and inspection reports",
+    "optimization": "analyze an investment and suggest specific optimizations to improve returns"
+}
+
 def _get_agent_description(agent_type: str) -> str:
     """Get a description for a specific agent type."""
-    descriptions = {
-        "market_data": "gather current market data for a specific location including prices, rents, and trends",
-        "rent_estimation": "estimate potential rental income based on property specifics and local market data",
-        "document_analysis": "extract key information from property documents like leases and inspection reports",
-        "optimization": "analyze an investment and suggest specific optimizations to improve returns"
-    }
-    return descriptions.get(agent_type, "perform a specialized task")
\ No newline at end of file
+    return AGENT_DESCRIPTIONS.get(agent_type, "perform a specialized task")
\ No newline at end of file
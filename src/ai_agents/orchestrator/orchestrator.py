@@ -5,19 +5,45 @@ This orchestrator coordinates specialized agents and maintains context across in
 """
 
 import asyncio
+import copy
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, List, Optional, TypeVar
 from uuid import uuid4
 from pydantic import BaseModel, Field
 import queue
 import time
 
 from agents import Agent, Runner, function_tool
+from openai.types.responses import ResponseTextDeltaEvent
+
+from ..cache import DEFAULT_TTL, ResponseCache, make_cache_key
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent agent runs, to stay within Azure OpenAI rate limits
+MAX_CONCURRENCY = 16
+
+T = TypeVar("T")
+
+async def gather_bounded(awaitables: Iterable[Awaitable[T]], max_concurrency: int = MAX_CONCURRENCY) -> List[T]:
+    """
+    Await several awaitables concurrently, running at most max_concurrency at a time.
+    
+    Args:
+        awaitables: Coroutines to run; they are not started until a slot is free
+        max_concurrency: Maximum number of awaitables running at the same time
+        
+    Returns:
+        Results in the same order as awaitables
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _run(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+    
+    return list(await asyncio.gather(*(_run(awaitable) for awaitable in awaitables)))
+
 class TaskResult(BaseModel):
     """Result of a task executed by an agent."""
     task_id: str
@@ -45,6 +71,8 @@ class AgentOrchestrator:
         self.manager_agent = None
         self.specialized_agents = {}
         self.results_cache = {}
+        # Successful agent outputs keyed on (agent type, input, parameters)
+        self.response_cache = ResponseCache(maxsize=1024, ttl=DEFAULT_TTL)
         self.task_queue = queue.Queue()
         self.task_status = {}  # Track status of tasks even after they've been processed
         logger.info("[Orchestrator] Initialized new Agent Orchestrator instance")
@@ -177,7 +205,13 @@ class AgentOrchestrator:
             logger.info(f"[Orchestrator] Tasks remaining in queue: {remaining}")
     
     async def execute_task(self, agent_type: str, input_text: str, **kwargs) -> TaskResult:
-        """Execute a task with a specialized agent."""
+        """
+        Execute a task with a specialized agent.
+        
+        Identical requests (same agent type, input and parameters) are answered from the
+        response cache for up to an hour instead of calling the model again. Only
+        successful runs are cached.
+        """
         task_id = str(uuid4())
         logger.info(f"[Orchestrator] Creating new task with ID: {task_id}")
         agent = self.get_specialized_agent(agent_type)
@@ -192,6 +226,19 @@ class AgentOrchestrator:
                 error=error_msg
             )
         
+        cache_key = make_cache_key(agent_type, input_text, kwargs)
+        cached_output = self.response_cache.get(cache_key)
+        if cached_output is not None:
+            logger.info(f"[Orchestrator] Answering task {task_id} from the response cache")
+            task_result = TaskResult(
+                task_id=task_id,
+                agent_name=agent.name,
+                status="success",
+                content={"final_output": copy.deepcopy(cached_output)}
+            )
+            self.results_cache[task_id] = task_result
+            return task_result
+        
         try:
             logger.info(f"[Orchestrator] Executing task {task_id} with agent {agent.name}")
             
@@ -220,6 +267,7 @@ class AgentOrchestrator:
             
             # Cache the result
             self.results_cache[task_id] = task_result
+            self.response_cache.set(cache_key, copy.deepcopy(result.final_output))
             result_size = len(str(result.final_output))
             logger.info(f"[Orchestrator] Cached result for task {task_id} ({result_size} chars)")
             return task_result
@@ -234,6 +282,66 @@ class AgentOrchestrator:
                 error=error_msg
             )
     
+    async def execute_tasks(self, agent_type: str, inputs: List[str],
+                            max_concurrency: int = MAX_CONCURRENCY, **kwargs) -> List[TaskResult]:
+        """
+        Execute several tasks with a specialized agent concurrently.
+        
+        Each input runs through execute_task, so a failing input produces a failed
+        TaskResult in its slot without affecting the others.
+        
+        Args:
+            agent_type: Type of specialized agent to use
+            inputs: Input texts, one per task
+            max_concurrency: Maximum number of agent runs in flight at the same time
+            
+        Returns:
+            Task results in the same order as inputs
+        """
+        logger.info(f"[Orchestrator] Executing {len(inputs)} tasks with {agent_type} agent (max {max_concurrency} concurrent)")
+        return await gather_bounded(
+            (self.execute_task(agent_type, input_text, **kwargs) for input_text in inputs),
+            max_concurrency
+        )
+    
+    async def stream_task(self, agent_type: str, input_text: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Execute a task with a specialized agent, yielding output text as it is generated.
+        
+        Args:
+            agent_type: Type of specialized agent to use
+            input_text: Input text for the agent
+            
+        Yields:
+            Incremental chunks of the agent's output text
+            
+        Raises:
+            ValueError: If no agent is registered for agent_type
+            RuntimeError: If the agent run fails before or during streaming; the
+                original exception is chained as the cause
+        """
+        agent = self.get_specialized_agent(agent_type)
+        if not agent:
+            error_msg = f"No agent found for type: {agent_type}"
+            logger.error(f"[Orchestrator] {error_msg}")
+            raise ValueError(error_msg)
+        
+        logger.info(f"[Orchestrator] Streaming task with agent {agent.name}")
+        
+        try:
+            # Store parameters in context for tool access, as in execute_task
+            context = {"parameters": kwargs}
+            result = Runner.run_streamed(agent, input_text, context=context)
+            async for event in result.stream_events():
+                if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+                    yield event.data.delta
+        except Exception as e:
+            error_msg = f"Error streaming task with agent {agent.name}: {str(e)}"
+            logger.error(f"[Orchestrator] {error_msg}")
+            raise RuntimeError(error_msg) from e
+        
+        logger.info(f"[Orchestrator] Streaming task completed by {agent.name}")
+    
     async def execute_with_manager(self, input_text: str, **kwargs) -> Any:
         """Execute a task using the manager agent to coordinate specialized agents."""
         if not self.manager_agent:
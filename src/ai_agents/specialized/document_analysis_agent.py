@@ -4,10 +4,11 @@ Document Analysis Agent implementation for the Property Investment Analysis Appl
 This specialized agent extracts and analyzes information from property documents.
 """
 
+import functools
 import logging
+import time
 from typing import Dict, Any, List, Optional
 import json
-from datetime import datetime
 
 from agents import Agent, function_tool, OpenAIChatCompletionsModel
 from pydantic import BaseModel
@@ -18,9 +19,8 @@ from ..tools.investment_tools import (
     parse_property_text,
     generate_section_explanation
 )
+from ..client import get_openai_client
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class DocumentAnalysisRequest(BaseModel):
@@ -37,88 +37,81 @@ class DocumentAnalysisResult(BaseModel):
     key_insights: List[str]
     explanation: str
 
+# Instructions for the document analysis agent
+DOCUMENT_ANALYSIS_INSTRUCTIONS = """
+You are a specialized Document Analysis Agent for property investment analysis.
+
+Your task is to extract, structure, and analyze information from property-related documents:
+1. Property listings
+2. Sales contracts
+3. Lease agreements
+4. Inspection reports
+5. Property management reports
+6. Financial documents
+
+Follow these steps when processing documents:
+1. Identify document type
+2. Extract key data points (dates, names, amounts, property details)
+3. Identify standard sections relevant to investment analysis
+4. Flag any unusual terms, conditions, or restrictions
+5. Structure information for further analysis
+
+Always include confidence scores for extracted data points and highlight any areas 
+of ambiguity or uncertainty.
+
+For property listings and inspection reports, extract:
+- Property details (size, rooms, features, conditions)
+- Noted issues or required repairs
+- Estimated costs of repairs
+
+For lease agreements, extract:
+- Rent amounts
+- Security deposits
+- Term duration
+- Renewal conditions
+- Tenant responsibilities
+- Special clauses
+
+For financial documents, extract:
+- Income figures
+- Expense categories
+- Profit calculations
+- Tax implications
+"""
+
+# Document extraction and classification tools
+DOCUMENT_ANALYSIS_TOOLS = (extract_document_text, classify_document_type, parse_property_text, generate_section_explanation)
+DOCUMENT_ANALYSIS_TOOL_NAMES = ", ".join(
+    tool.__name__ if hasattr(tool, '__name__') else tool.name for tool in DOCUMENT_ANALYSIS_TOOLS
+)
+
+@functools.lru_cache(maxsize=1)
 def create_document_analysis_agent() -> Agent:
-    """Create and configure the Document Analysis Agent."""
-    
-    logger.info("[Document Analysis] Creating document analysis agent")
-    
-    # Define agent instructions
-    instructions = """
-    You are a specialized Document Analysis Agent for property investment analysis.
-    
-    Your task is to extract, structure, and analyze information from property-related documents:
-    1. Property listings
-    2. Sales contracts
-    3. Lease agreements
-    4. Inspection reports
-    5. Property management reports
-    6. Financial documents
-    
-    Follow these steps when processing documents:
-    1. Identify document type
-    2. Extract key data points (dates, names, amounts, property details)
-    3. Identify standard sections relevant to investment analysis
-    4. Flag any unusual terms, conditions, or restrictions
-    5. Structure information for further analysis
-    
-    Always include confidence scores for extracted data points and highlight any areas 
-    of ambiguity or uncertainty.
-    
-    For property listings and inspection reports, extract:
-    - Property details (size, rooms, features, conditions)
-    - Noted issues or required repairs
-    - Estimated costs of repairs
-    
-    For lease agreements, extract:
-    - Rent amounts
-    - Security deposits
-    - Term duration
-    - Renewal conditions
-    - Tenant responsibilities
-    - Special clauses
+    """
+    Create and configure the Document Analysis Agent.
     
-    For financial documents, extract:
-    - Income figures
-    - Expense categories
-    - Profit calculations
-    - Tax implications
+    The agent is built once per process; later calls return the same instance.
     """
     
-    from openai import AsyncAzureOpenAI
-    from agents import set_default_openai_client
-    from dotenv import load_dotenv
-    import os
-
-    # Load environment variables
-    load_dotenv()
+    logger.info("[Document Analysis] Creating document analysis agent")
     logger.info("[Document Analysis] Configuring integration with Azure OpenAI services")
     
-    # Create OpenAI client using Azure OpenAI
-    openai_client = AsyncAzureOpenAI(
-        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-        api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
-        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-        azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
-    )
-
-    # Set the default OpenAI client for the Agents SDK
-    set_default_openai_client(openai_client)
+    # Use the shared Azure OpenAI client
+    openai_client = get_openai_client()
     logger.info("[Document Analysis] OpenAI client configured for agent")
 
     # Log the available tools
-    tools = [extract_document_text, classify_document_type, parse_property_text, generate_section_explanation]
-    tool_names = [tool.__name__ if hasattr(tool, '__name__') else tool.name for tool in tools]
-    logger.info(f"[Document Analysis] Setting up agent with tools: {', '.join(tool_names)}")
+    logger.info("[Document Analysis] Setting up agent with tools: %s", DOCUMENT_ANALYSIS_TOOL_NAMES)
 
     # Create and return the agent
     agent = Agent(
         name="Document Analysis Agent",
-        instructions=instructions,
+        instructions=DOCUMENT_ANALYSIS_INSTRUCTIONS,
         model=OpenAIChatCompletionsModel(
             model="gpt-4o",
             openai_client=openai_client
         ),
-        tools=tools
+        tools=list(DOCUMENT_ANALYSIS_TOOLS)
     )
     
     logger.info("[Document Analysis] Document analysis agent successfully initialized")
@@ -138,47 +131,32 @@ def process_document_with_logging(document_type: str, document_text: str, extrac
     Returns:
         Dictionary containing the extracted and analyzed data
     """
-    start_time = datetime.now()
-    text_length = len(document_text)
-    logger.info(f"[Document Analysis] Starting analysis of {document_type} document ({text_length} characters)")
-    
-    if extraction_targets:
-        logger.info(f"[Document Analysis] Targeting extraction of: {', '.join(extraction_targets)}")
+    start_time = time.perf_counter()
+    logger.info(
+        "[Document Analysis] Starting analysis of %s document (%d characters), targets: %s",
+        document_type, len(document_text), ", ".join(extraction_targets) if extraction_targets else "all"
+    )
     
     try:
-        # Log document classification check
-        logger.info(f"[Document Analysis] Verifying document type classification")
-        
-        # Log text extraction process
-        logger.info(f"[Document Analysis] Extracting text content from document")
-        
-        # Simulate document processing steps
-        if document_type == "lease_agreement":
-            logger.info(f"[Document Analysis] Analyzing lease agreement terms and conditions")
-            logger.info(f"[Document Analysis] Extracting rent amounts, deposit information, and lease duration")
-            logger.info(f"[Document Analysis] Checking for special clauses and restrictions")
-        elif document_type == "inspection_report":
-            logger.info(f"[Document Analysis] Analyzing property inspection details")
-            logger.info(f"[Document Analysis] Identifying reported issues and maintenance requirements")
-            logger.info(f"[Document Analysis] Estimating repair costs based on report data")
-        elif document_type == "property_listing":
-            logger.info(f"[Document Analysis] Extracting property specifications and features")
-            logger.info(f"[Document Analysis] Analyzing property description for relevant investment details")
-        else:
-            logger.info(f"[Document Analysis] Processing general document content")
-        
-        # Calculate confidence scores for extracted data
-        logger.info(f"[Document Analysis] Calculating confidence scores for extracted data points")
-        
-        # Generate document structure analysis
-        logger.info(f"[Document Analysis] Generating document structure analysis")
-        
-        # Identify key insights
-        logger.info(f"[Document Analysis] Identifying key insights for investment decision-making")
+        # Log processing steps for the document type
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[Document Analysis] Verifying document type classification and extracting text content")
+            
+            # Simulate document processing steps
+            if document_type == "lease_agreement":
+                logger.debug("[Document Analysis] Analyzing lease agreement terms, rent amounts, deposit, duration and special clauses")
+            elif document_type == "inspection_report":
+                logger.debug("[Document Analysis] Analyzing inspection details, reported issues and estimated repair costs")
+            elif document_type == "property_listing":
+                logger.debug("[Document Analysis] Extracting property specifications, features and investment details")
+            else:
+                logger.debug("[Document Analysis] Processing general document content")
+            
+            logger.debug("[Document Analysis] Calculating confidence scores, structure analysis and key insights")
         
         # Calculate execution time
-        execution_time = (datetime.now() - start_time).total_seconds()
-        logger.info(f"[Document Analysis] Document analysis completed in {execution_time:.2f} seconds")
+        execution_time = time.perf_counter() - start_time
+        logger.info("[Document Analysis] Document analysis completed in %.2f seconds", execution_time)
         
         # Return sample structured data
         return {
@@ -188,5 +166,5 @@ def process_document_with_logging(document_type: str, document_text: str, extrac
             "execution_time": execution_time
         }
     except Exception as e:
-        logger.error(f"[Document Analysis] Error processing document: {str(e)}")
+        logger.error("[Document Analysis] Error processing document: %s", e)
         raise
\ No newline at end of file
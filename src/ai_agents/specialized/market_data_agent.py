@@ -5,12 +5,13 @@ This specialized agent collects current rental rates, property values, vacancy r
 and market trends for target locations.
 """
 
+import functools
 import logging
 from typing import Dict, Any, List, Optional
 import json
 
 from agents import Agent, function_tool, OpenAIChatCompletionsModel
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ..tools.investment_tools import (
     web_search,
@@ -19,9 +20,8 @@ from ..tools.investment_tools import (
     gather_historical_data,
     search_development_news
 )
+from ..client import get_openai_client
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class MarketDataRequest(BaseModel):
@@ -31,9 +31,7 @@ class MarketDataRequest(BaseModel):
     data_types: List[str]
     timeframe: Optional[str] = "5 years"
     
-    model_config = {
-        "extra": "forbid"
-    }
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class MarketDataResult(BaseModel):
     """Result from the Market Data Search Agent."""
@@ -47,12 +45,15 @@ class MarketDataResult(BaseModel):
     sources: List[str]
     timestamp: str
     
-    model_config = {
-        "extra": "forbid"
-    }
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
+@functools.lru_cache(maxsize=1)
 def create_market_data_search_agent() -> Agent:
-    """Create and configure the Market Data Search Agent."""
+    """
+    Create and configure the Market Data Search Agent.
+    
+    The agent is built once per process; later calls return the same instance.
+    """
     
     # Define agent instructions
     instructions = """
@@ -76,23 +77,8 @@ def create_market_data_search_agent() -> Agent:
     Always include confidence scores for all data points and cite sources for all information.
     Flag any inconsistent or contradictory data from different sources.
     """
-    from openai import AsyncAzureOpenAI
-    from agents import set_default_openai_client
-    from dotenv import load_dotenv
-    import os
-
-    # Load environment variables
-    load_dotenv()
-    # Create OpenAI client using Azure OpenAI
-    openai_client = AsyncAzureOpenAI(
-        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-        api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
-        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-        azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
-    )
-
-    # Set the default OpenAI client for the Agents SDK
-    set_default_openai_client(openai_client)
+    # Use the shared Azure OpenAI client
+    openai_client = get_openai_client()
     # Create and return the agent
     return Agent(
         name="Market Data Search Agent",
@@ -5,22 +5,22 @@ This specialized agent analyzes investment properties and suggests specific opti
 to improve investment returns.
 """
 
+import functools
 import logging
+import time
 from typing import Dict, Any, List, Optional
 import json
-from datetime import datetime
 
-from agents import Agent, function_tool, OpenAIChatCompletionsModel
-from pydantic import BaseModel
+from agents import Agent, ModelSettings, function_tool, OpenAIChatCompletionsModel
+from pydantic import BaseModel, ConfigDict
 
 from ..tools.investment_tools import (
     analyze_investment_efficiency,
     simulate_optimizations,
     generate_section_explanation
 )
+from ..client import get_light_model_client
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class OptimizationRequest(BaseModel):
@@ -28,6 +28,8 @@ class OptimizationRequest(BaseModel):
     property_data: Dict[str, Any]
     financial_data: Dict[str, Any]
     investor_goals: Optional[Dict[str, Any]] = None
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class OptimizationResult(BaseModel):
     """Result from the Optimization Agent."""
@@ -37,82 +39,88 @@ class OptimizationResult(BaseModel):
     prioritized_actions: List[Dict[str, Any]]
     timeframes: Dict[str, Any]
     explanation: str
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+# Instructions for the optimization agent
+OPTIMIZATION_INSTRUCTIONS = """
+You are a specialized Optimization Recommendation Agent for property investment analysis.
+
+Your task is to analyze investment properties and suggest specific optimizations to improve returns:
+1. Review complete property and financial data
+2. Identify potentially suboptimal aspects (financing, rent, expenses)
+3. Generate possible optimization strategies
+4. Simulate impact of each strategy on ROI and cash flow
+5. Prioritize recommendations by implementation cost and benefit
+6. Provide specific implementation steps with timeframes
+
+Focus on practical, actionable recommendations in these key areas:
+- Financing adjustments (refinancing, changing loan terms)
+- Rental income optimization (rent adjustments, unit improvements)
+- Expense reduction (management fees, maintenance costs)
+- Tax benefit maximization (depreciation strategies, deductible expenses)
+- Property improvements with positive ROI
+
+Always prioritize recommendations by:
+1. Ease of implementation (low effort to high effort)
+2. Cost to implement (low cost to high cost)
+3. Expected impact on returns (high impact to low impact)
+4. Time to realize benefits (immediate to long-term)
+
+Provide specific, numeric projections for how each recommendation would affect:
+- Monthly cash flow
+- Cash-on-cash return
+- Overall ROI
+- Implementation costs
+- Payback period
+
+Ensure all recommendations comply with legal requirements and include any risks or potential downsides.
+
+Examples:
+Input: {"property_data": {"property_type": "apartment", "location": "Berlin"}, "financial_data": {"monthly_rent": 900, "interest_rate": 4.8, "management_fee_pct": 10}}
+Output: {"recommendations": [{"category": "financing", "action": "Refinance at 3.9%", "impact": "+€110/month"}, {"category": "expenses", "action": "Renegotiate management fee to 7%", "impact": "+€27/month"}], "projected_impact": {"monthly_cash_flow": "+€137"}, "implementation_costs": {"refinancing": 1500}, "prioritized_actions": [{"action": "Renegotiate management fee to 7%", "priority": 1}, {"action": "Refinance at 3.9%", "priority": 2}], "timeframes": {"Renegotiate management fee to 7%": "1 month", "Refinance at 3.9%": "3 months"}, "explanation": "Fee renegotiation is free and immediate; refinancing pays back its costs in about 14 months."}
 
+Input: {"property_data": {"property_type": "multi_family", "location": "Leipzig", "num_units": 6}, "financial_data": {"monthly_rent": 4200, "vacancy_rate": 12, "maintenance_reserve": 600}, "investor_goals": {"priority": "cash_flow"}}
+Output: {"recommendations": [{"category": "rental_income", "action": "Cut vacancy to 5% with faster re-letting", "impact": "+€295/month"}, {"category": "property_improvements", "action": "Add in-unit washers to two units", "impact": "+€80/month"}], "projected_impact": {"monthly_cash_flow": "+€375"}, "implementation_costs": {"re-letting": 0, "washers": 1800}, "prioritized_actions": [{"action": "Cut vacancy to 5% with faster re-letting", "priority": 1}, {"action": "Add in-unit washers to two units", "priority": 2}], "timeframes": {"Cut vacancy to 5% with faster re-letting": "2 months", "Add in-unit washers to two units": "4 months"}, "explanation": "Vacancy is the largest cash-flow drag; the washers pay back in about 23 months."}
+"""
+
+# Efficiency analysis and simulation tools
+OPTIMIZATION_TOOLS = (analyze_investment_efficiency, simulate_optimizations, generate_section_explanation)
+OPTIMIZATION_TOOL_NAMES = ", ".join(
+    tool.__name__ if hasattr(tool, '__name__') else tool.name for tool in OPTIMIZATION_TOOLS
+)
+
+@functools.lru_cache(maxsize=1)
 def create_optimization_agent() -> Agent:
-    """Create and configure the Optimization Agent."""
-    
-    logger.info("[Optimization] Creating optimization recommendation agent")
-    
-    # Define agent instructions
-    instructions = """
-    You are a specialized Optimization Recommendation Agent for property investment analysis.
-    
-    Your task is to analyze investment properties and suggest specific optimizations to improve returns:
-    1. Review complete property and financial data
-    2. Identify potentially suboptimal aspects (financing, rent, expenses)
-    3. Generate possible optimization strategies
-    4. Simulate impact of each strategy on ROI and cash flow
-    5. Prioritize recommendations by implementation cost and benefit
-    6. Provide specific implementation steps with timeframes
-    
-    Focus on practical, actionable recommendations in these key areas:
-    - Financing adjustments (refinancing, changing loan terms)
-    - Rental income optimization (rent adjustments, unit improvements)
-    - Expense reduction (management fees, maintenance costs)
-    - Tax benefit maximization (depreciation strategies, deductible expenses)
-    - Property improvements with positive ROI
+    """
+    Create and configure the Optimization Agent.
     
-    Always prioritize recommendations by:
-    1. Ease of implementation (low effort to high effort)
-    2. Cost to implement (low cost to high cost)
-    3. Expected impact on returns (high impact to low impact)
-    4. Time to realize benefits (immediate to long-term)
+    The agent is built once per process; later calls return the same instance. It runs on
+    the lightweight model deployment when AZURE_OPENAI_MINI_DEPLOYMENT_NAME is configured.
+    """
     
-    Provide specific, numeric projections for how each recommendation would affect:
-    - Monthly cash flow
-    - Cash-on-cash return
-    - Overall ROI
-    - Implementation costs
-    - Payback period
+    logger.info("[Optimization] Creating optimization recommendation agent")
     
-    Ensure all recommendations comply with legal requirements and include any risks or potential downsides.
-    """
-
-    from openai import AsyncAzureOpenAI
-    from agents import set_default_openai_client
-    from dotenv import load_dotenv
-    import os
-
-    # Load environment variables
-    load_dotenv()
     logger.info("[Optimization] Configuring integration with Azure OpenAI services")
     
-    # Create OpenAI client using Azure OpenAI
-    openai_client = AsyncAzureOpenAI(
-        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-        api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
-        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-        azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
-    )
-
-    # Set the default OpenAI client for the Agents SDK
-    set_default_openai_client(openai_client)
-    logger.info("[Optimization] OpenAI client configured for agent")
+    # Use the shared client for the lightweight model deployment, if one is configured
+    openai_client, model = get_light_model_client()
+    logger.info("[Optimization] OpenAI client configured for agent using model %s", model)
     
     # Log the available tools
-    tools = [analyze_investment_efficiency, simulate_optimizations, generate_section_explanation]
-    tool_names = [tool.__name__ if hasattr(tool, '__name__') else tool.name for tool in tools]
-    logger.info(f"[Optimization] Setting up agent with tools: {', '.join(tool_names)}")
+    logger.info("[Optimization] Setting up agent with tools: %s", OPTIMIZATION_TOOL_NAMES)
     
     # Create and return the agent
     agent = Agent(
         name="Optimization Agent",
-        instructions=instructions,
+        instructions=OPTIMIZATION_INSTRUCTIONS,
         model=OpenAIChatCompletionsModel(
-            model="gpt-4o",
+            model=model,
             openai_client=openai_client
         ),
-        tools=tools
+        # Results are short structured answers, so bound the decode budget
+        model_settings=ModelSettings(temperature=0.2, max_tokens=800),
+        tools=list(OPTIMIZATION_TOOLS)
     )
     
     logger.info("[Optimization] Optimization agent successfully initialized")
@@ -133,56 +141,35 @@ def optimize_investment_with_logging(property_data: Dict[str, Any], financial_da
     Returns:
         Dictionary containing optimization recommendations and projected impacts
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     property_type = property_data.get("property_type", "unknown")
     property_location = property_data.get("location", "unknown")
     
-    logger.info(f"[Optimization] Starting optimization analysis for {property_type} in {property_location}")
-    
-    if investor_goals:
-        goal_types = list(investor_goals.keys())
-        logger.info(f"[Optimization] Investor goals specified: {', '.join(goal_types)}")
-        for goal, value in investor_goals.items():
-            logger.info(f"[Optimization] Goal - {goal}: {value}")
+    logger.info("[Optimization] Starting optimization analysis for %s in %s", property_type, property_location)
     
     try:
-        # Log efficiency analysis
-        logger.info(f"[Optimization] Analyzing current investment efficiency")
-        logger.info(f"[Optimization] Examining property data for optimization opportunities")
-        logger.info(f"[Optimization] Examining financial structure for inefficiencies")
-        
-        # Log suboptimal aspects identification
-        logger.info(f"[Optimization] Identifying potentially suboptimal investment aspects")
-        
-        # Log generation of optimization strategies
-        logger.info(f"[Optimization] Generating potential optimization strategies")
-        
-        # Log simulation of impacts
-        logger.info(f"[Optimization] Simulating impact of each optimization strategy")
-        
-        # Log categorization of recommendations
-        categories = ["financing", "rental_income", "expenses", "tax_benefits", "property_improvements"]
-        recommendations_count = {cat: 0 for cat in categories}
-        
-        # Simulate finding recommendations in each category
-        recommendations_count["financing"] = 2
-        recommendations_count["rental_income"] = 1
-        recommendations_count["expenses"] = 2
-        
-        for category, count in recommendations_count.items():
-            if count > 0:
-                logger.info(f"[Optimization] Found {count} recommendations for {category}")
-        
-        # Log prioritization of actions
-        logger.info(f"[Optimization] Prioritizing recommendations by implementation cost and benefit")
-        
-        # Log timeframe analysis
-        logger.info(f"[Optimization] Determining implementation timeframes for recommendations")
+        # Log analysis steps
+        if logger.isEnabledFor(logging.DEBUG):
+            if investor_goals:
+                logger.debug("[Optimization] Investor goals specified: %s", ", ".join(investor_goals))
+                for goal, value in investor_goals.items():
+                    logger.debug("[Optimization] Goal - %s: %s", goal, value)
+            
+            logger.debug("[Optimization] Analyzing current investment efficiency of property and financial data")
+            logger.debug("[Optimization] Identifying suboptimal aspects and generating optimization strategies")
+            logger.debug("[Optimization] Simulating impact of each optimization strategy")
+            
+            # Simulate finding recommendations in each category
+            recommendations_count = {"financing": 2, "rental_income": 1, "expenses": 2}
+            for category, count in recommendations_count.items():
+                logger.debug("[Optimization] Found %d recommendations for %s", count, category)
+            
+            logger.debug("[Optimization] Prioritizing recommendations and determining implementation timeframes")
         
         # Calculate execution time
-        execution_time = (datetime.now() - start_time).total_seconds()
-        logger.info(f"[Optimization] Optimization analysis completed in {execution_time:.2f} seconds")
+        execution_time = time.perf_counter() - start_time
+        logger.info("[Optimization] Optimization analysis completed in %.2f seconds", execution_time)
         
         # Return sample results
         recommendations = [
@@ -193,7 +180,7 @@ def optimize_investment_with_logging(property_data: Dict[str, Any], financial_da
             {"category": "expenses", "action": "Bundle insurance policies", "impact": "+€30/month"}
         ]
         
-        logger.info(f"[Optimization] Generated {len(recommendations)} optimization recommendations")
+        logger.info("[Optimization] Generated %d optimization recommendations", len(recommendations))
         
         # Return structured data
         return {
@@ -203,5 +190,5 @@ def optimize_investment_with_logging(property_data: Dict[str, Any], financial_da
             "execution_time": execution_time
         }
     except Exception as e:
-        logger.error(f"[Optimization] Error in optimization analysis: {str(e)}")
-        raise
\ No newline at end of file
+        logger.error("[Optimization] Error in optimization analysis: %s", e)
+        raise
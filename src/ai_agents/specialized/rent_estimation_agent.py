@@ -4,22 +4,22 @@ Rent Estimation Agent implementation for the Property Investment Analysis Applic
 This specialized agent generates rental estimates based on property specifics and market data.
 """
 
+import functools
 import logging
+import time
 from typing import Dict, Any, List, Optional
 import json
-from datetime import datetime
 
-from agents import Agent, function_tool, OpenAIChatCompletionsModel
-from pydantic import BaseModel
+from agents import Agent, ModelSettings, function_tool, OpenAIChatCompletionsModel
+from pydantic import BaseModel, ConfigDict
 
 from ..tools.investment_tools import (
     query_market_data,
     analyze_comparables,
     parse_property_text
 )
+from ..client import get_light_model_client
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class RentEstimateRequest(BaseModel):
@@ -31,6 +31,8 @@ class RentEstimateRequest(BaseModel):
     condition: Optional[str] = None
     features: Optional[List[str]] = None
     check_rent_control: Optional[bool] = True
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class RentEstimateResult(BaseModel):
     """Result from the Rent Estimation Agent."""
@@ -44,70 +46,76 @@ class RentEstimateResult(BaseModel):
     rent_control_flag: Optional[bool] = False
     confidence_score: float
     explanation: str
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+# Instructions for the rent estimation agent
+RENT_ESTIMATION_INSTRUCTIONS = """
+You are a specialized Rent Estimation Agent for property investment analysis.
+
+Your task is to generate accurate rental estimates for properties based on:
+1. Property specifics (size, features, condition)
+2. Current market data and comparable properties
+3. Location-specific factors
+4. Legal limitations (like rent control)
+
+Follow these steps when processing requests:
+1. Retrieve property specifics (size, features, condition)
+2. Query database for comparable properties in location
+3. Analyze key factors affecting rent (renovations, amenities, etc.)
+4. Generate estimate with low/medium/high ranges
+5. Check against rent control limits (Mietpreisbremse) and flag if exceeded
+
+Your estimates should be well-reasoned and include confidence levels. 
+When legal rent control limitations apply, explicitly flag this in your response.
+Provide clear explanations for which property characteristics have the most significant 
+impact on your estimate.
 
+Examples:
+Input: {"location": "Munich", "property_type": "apartment", "size_sqm": 65, "year_built": 1995, "condition": "good"}
+Output: {"property_address": "Munich", "estimated_rent": 1300, "low_range": 1170, "high_range": 1430, "rent_per_sqm": 20.0, "comparable_properties": [{"size_sqm": 60, "rent": 1220}, {"size_sqm": 70, "rent": 1390}], "key_factors": ["location", "size", "condition"], "rent_control_flag": true, "confidence_score": 0.8, "explanation": "Comparable two-room apartments rent for about €20/sqm; the Mietpreisbremse cap applies in Munich."}
+
+Input: {"location": "Dresden", "property_type": "house", "size_sqm": 120, "year_built": 1938, "condition": "needs renovation", "features": ["garden"]}
+Output: {"property_address": "Dresden", "estimated_rent": 1080, "low_range": 960, "high_range": 1200, "rent_per_sqm": 9.0, "comparable_properties": [{"size_sqm": 115, "rent": 1150}, {"size_sqm": 130, "rent": 1240}], "key_factors": ["condition", "size", "garden"], "rent_control_flag": false, "confidence_score": 0.65, "explanation": "Renovated comparables reach about €9.80/sqm; the renovation backlog lowers the estimate and widens the range."}
+"""
+
+# Market data and comparables tools
+RENT_ESTIMATION_TOOLS = (query_market_data, analyze_comparables, parse_property_text)
+RENT_ESTIMATION_TOOL_NAMES = ", ".join(
+    tool.__name__ if hasattr(tool, '__name__') else tool.name for tool in RENT_ESTIMATION_TOOLS
+)
+
+@functools.lru_cache(maxsize=1)
 def create_rent_estimation_agent() -> Agent:
-    """Create and configure the Rent Estimation Agent."""
-    
-    logger.info("[Rent Estimation] Creating rent estimation agent")
-    
-    # Define agent instructions
-    instructions = """
-    You are a specialized Rent Estimation Agent for property investment analysis.
-    
-    Your task is to generate accurate rental estimates for properties based on:
-    1. Property specifics (size, features, condition)
-    2. Current market data and comparable properties
-    3. Location-specific factors
-    4. Legal limitations (like rent control)
-    
-    Follow these steps when processing requests:
-    1. Retrieve property specifics (size, features, condition)
-    2. Query database for comparable properties in location
-    3. Analyze key factors affecting rent (renovations, amenities, etc.)
-    4. Generate estimate with low/medium/high ranges
-    5. Check against rent control limits (Mietpreisbremse) and flag if exceeded
+    """
+    Create and configure the Rent Estimation Agent.
     
-    Your estimates should be well-reasoned and include confidence levels. 
-    When legal rent control limitations apply, explicitly flag this in your response.
-    Provide clear explanations for which property characteristics have the most significant 
-    impact on your estimate.
+    The agent is built once per process; later calls return the same instance. It runs on
+    the lightweight model deployment when AZURE_OPENAI_MINI_DEPLOYMENT_NAME is configured.
     """
     
-    from openai import AsyncAzureOpenAI
-    from agents import set_default_openai_client
-    from dotenv import load_dotenv
-    import os
-
-    # Load environment variables
-    load_dotenv()
+    logger.info("[Rent Estimation] Creating rent estimation agent")
+    
     logger.info("[Rent Estimation] Configuring integration with Azure OpenAI services")
     
-    # Create OpenAI client using Azure OpenAI
-    openai_client = AsyncAzureOpenAI(
-        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-        api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
-        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-        azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
-    )
-
-    # Set the default OpenAI client for the Agents SDK
-    set_default_openai_client(openai_client)
-    logger.info("[Rent Estimation] OpenAI client configured for agent")
+    # Use the shared client for the lightweight model deployment, if one is configured
+    openai_client, model = get_light_model_client()
+    logger.info("[Rent Estimation] OpenAI client configured for agent using model %s", model)
 
     # Log the available tools
-    tools = [query_market_data, analyze_comparables, parse_property_text]
-    tool_names = [tool.__name__ if hasattr(tool, '__name__') else tool.name for tool in tools]
-    logger.info(f"[Rent Estimation] Setting up agent with tools: {', '.join(tool_names)}")
+    logger.info("[Rent Estimation] Setting up agent with tools: %s", RENT_ESTIMATION_TOOL_NAMES)
 
     # Create and return the agent
     agent = Agent(
         name="Rent Estimation Agent",
-        instructions=instructions,
+        instructions=RENT_ESTIMATION_INSTRUCTIONS,
         model=OpenAIChatCompletionsModel(
-            model="gpt-4o",
+            model=model,
             openai_client=openai_client
         ),
-        tools=tools
+        # Results are short structured answers, so bound the decode budget
+        model_settings=ModelSettings(temperature=0.2, max_tokens=800),
+        tools=list(RENT_ESTIMATION_TOOLS)
     )
     
     logger.info("[Rent Estimation] Rent estimation agent successfully initialized")
@@ -125,32 +133,29 @@ def estimate_rent_with_logging(location: str, property_details: Dict[str, Any])
     Returns:
         RentEstimateResult containing the rent estimation
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     try:
         size_sqm = property_details.get("size_sqm", 0)
         property_type = property_details.get("property_type", "unknown")
-        features = property_details.get("features", [])
-        condition = property_details.get("condition", "average")
-        
-        logger.info(f"[Rent Estimation] Starting rent estimation for {size_sqm}sqm {property_type} in {location}")
-        logger.info(f"[Rent Estimation] Property features: {', '.join(features)}")
-        logger.info(f"[Rent Estimation] Property condition: {condition}")
-        
-        # Log that we're querying market data
-        logger.info(f"[Rent Estimation] Querying comparable properties data for {location}")
         
-        # Log analysis of key factors
-        logger.info(f"[Rent Estimation] Analyzing factors affecting rental value")
+        logger.info("[Rent Estimation] Starting rent estimation for %ssqm %s in %s", size_sqm, property_type, location)
         
-        # Log rent control check if enabled
-        check_rent_control = property_details.get("check_rent_control", True)
-        if check_rent_control:
-            logger.info(f"[Rent Estimation] Checking rent control regulations for {location}")
+        # Log property details and estimation steps
+        if logger.isEnabledFor(logging.DEBUG):
+            features = property_details.get("features", [])
+            condition = property_details.get("condition", "average")
+            logger.debug("[Rent Estimation] Property features: %s", ", ".join(features))
+            logger.debug("[Rent Estimation] Property condition: %s", condition)
+            logger.debug("[Rent Estimation] Querying comparable properties data for %s", location)
+            logger.debug("[Rent Estimation] Analyzing factors affecting rental value")
+            
+            if property_details.get("check_rent_control", True):
+                logger.debug("[Rent Estimation] Checking rent control regulations for %s", location)
         
         # Calculate execution time
-        execution_time = (datetime.now() - start_time).total_seconds()
-        logger.info(f"[Rent Estimation] Estimation completed in {execution_time:.2f} seconds")
+        execution_time = time.perf_counter() - start_time
+        logger.info("[Rent Estimation] Estimation completed in %.2f seconds", execution_time)
         
         # Return dummy result for demonstration
         # In production, this would call the actual estimation logic
@@ -167,5 +172,5 @@ def estimate_rent_with_logging(location: str, property_details: Dict[str, Any])
             explanation="Example rent estimation."
         )
     except Exception as e:
-        logger.error(f"[Rent Estimation] Error in rent estimation: {str(e)}")
-        raise
\ No newline at end of file
+        logger.error("[Rent Estimation] Error in rent estimation: %s", e)
+        raise
@@ -4,17 +4,25 @@ Reusable tools for AI agents in the Property Investment Analysis Application.
 This module implements various tools that can be used by multiple specialized agents.
 """
 
+import hashlib
 import logging
-import json
+import orjson
 import requests
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from pydantic import BaseModel, Field
 from agents import function_tool
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from ..cache import ResponseCache
+
 logger = logging.getLogger(__name__)
 
+# Document classifications keyed by a digest of the text, so cached entries stay small
+_classification_cache = ResponseCache(maxsize=1024)
+
+def _to_json(obj: Any) -> str:
+    """Serialize a tool result to a JSON string (the Agents SDK expects str output)."""
+    return orjson.dumps(obj).decode()
+
 # Tool response models
 class MarketData(BaseModel):
     """Market data retrieved from various sources."""
@@ -78,12 +86,12 @@ def web_search(location: str, data_type: str) -> str:
         JSON string containing search results
     """
     # Enhanced logging with more detailed information
-    logger.info(f"[Market Data] Starting web search for {data_type} data in {location}")
-    logger.info(f"[Market Data] Searching web sources for {location} {data_type}")
+    logger.info("[Market Data] Starting web search for %s data in %s", data_type, location)
+    logger.info("[Market Data] Searching web sources for %s %s", location, data_type)
     
     # Simulate search results for demonstration
     if data_type == "prices":
-        logger.info(f"[Market Data] Accessing price data sources for {location}")
+        logger.info("[Market Data] Accessing price data sources for %s", location)
         result = {
             "average_price_sqm": 4500,
             "price_range": {"min": 3800, "max": 5200},
@@ -91,9 +99,9 @@ def web_search(location: str, data_type: str) -> str:
             "source": "realestate.example.com",
             "confidence": 0.85
         }
-        logger.info(f"[Market Data] Found price data: average {result['average_price_sqm']} EUR/sqm in {location}")
+        logger.info("[Market Data] Found price data: average %s EUR/sqm in %s", result['average_price_sqm'], location)
     elif data_type == "rents":
-        logger.info(f"[Market Data] Accessing rental data sources for {location}")
+        logger.info("[Market Data] Accessing rental data sources for %s", location)
         result = {
             "average_rent_sqm": 25.5,
             "rent_range": {"min": 18, "max": 30},
@@ -101,9 +109,9 @@ def web_search(location: str, data_type: str) -> str:
             "source": "rentaldata.example.com",
             "confidence": 0.9
         }
-        logger.info(f"[Market Data] Found rental data: average {result['average_rent_sqm']} EUR/sqm in {location}")
+        logger.info("[Market Data] Found rental data: average %s EUR/sqm in %s", result['average_rent_sqm'], location)
     elif data_type == "trends":
-        logger.info(f"[Market Data] Accessing market trend sources for {location}")
+        logger.info("[Market Data] Accessing market trend sources for %s", location)
         result = {
             "yearly_appreciation": 5.2,
             "forecast_5y": 18.5,
@@ -111,13 +119,13 @@ def web_search(location: str, data_type: str) -> str:
             "source": "markettrends.example.com",
             "confidence": 0.75
         }
-        logger.info(f"[Market Data] Found market trends: {result['yearly_appreciation']}% yearly appreciation in {location}")
+        logger.info("[Market Data] Found market trends: %s%% yearly appreciation in %s", result['yearly_appreciation'], location)
     else:
-        logger.warning(f"[Market Data] Unknown data type requested: {data_type}")
+        logger.warning("[Market Data] Unknown data type requested: %s", data_type)
         result = {"error": "Unknown data type", "confidence": 0}
     
-    logger.info(f"[Market Data] Web search completed for {location} {data_type} with confidence: {result.get('confidence', 0)}")
-    return json.dumps(result)
+    logger.info("[Market Data] Web search completed for %s %s with confidence: %s", location, data_type, result.get('confidence', 0))
+    return _to_json(result)
 
 @function_tool
 def parse_market_data(raw_data: str) -> str:
@@ -133,13 +141,13 @@ def parse_market_data(raw_data: str) -> str:
     logger.info("[Market Data] Starting to parse raw market data")
     
     try:
-        data = json.loads(raw_data)
+        data = orjson.loads(raw_data)
         
         # Log the data type being processed
         data_sources = []
         if "source" in data:
             data_sources.append(data["source"])
-            logger.info(f"[Market Data] Processing data from source: {data['source']}")
+            logger.info("[Market Data] Processing data from source: %s", data['source'])
         
         # This would contain more complex parsing logic in production
         parsed_data = {
@@ -148,14 +156,14 @@ def parse_market_data(raw_data: str) -> str:
             "timestamp": "2025-04-26T10:00:00Z"
         }
         
-        logger.info(f"[Market Data] Successfully parsed data with {len(data.keys())} fields")
+        logger.info("[Market Data] Successfully parsed data with %s fields", len(data.keys()))
         if "confidence" in data:
-            logger.info(f"[Market Data] Data confidence score: {data['confidence']}")
+            logger.info("[Market Data] Data confidence score: %s", data['confidence'])
         
-        return json.dumps(parsed_data)
+        return _to_json(parsed_data)
     except Exception as e:
-        logger.error(f"[Market Data] Error parsing market data: {str(e)}")
-        return json.dumps({"error": str(e)})
+        logger.error("[Market Data] Error parsing market data: %s", e)
+        return _to_json({"error": str(e)})
 
 @function_tool
 def query_market_data(location: str, property_type: str) -> str:
@@ -169,8 +177,8 @@ def query_market_data(location: str, property_type: str) -> str:
     Returns:
         JSON string with comparable properties data
     """
-    logger.info(f"[Market Data] Querying database for {property_type} properties in {location}")
-    logger.info(f"[Market Data] Looking for comparable properties in database with location={location}, type={property_type}")
+    logger.info("[Market Data] Querying database for %s properties in %s", property_type, location)
+    logger.info("[Market Data] Looking for comparable properties in database with location=%s, type=%s", location, property_type)
     
     # Simulate database query results
     comparables = [
@@ -203,11 +211,12 @@ def query_market_data(location: str, property_type: str) -> str:
         }
     ]
     
-    logger.info(f"[Market Data] Found {len(comparables)} comparable properties in {location}")
-    logger.info(f"[Market Data] Price range for comparable properties: {min([c['price'] for c in comparables])} - {max([c['price'] for c in comparables])} EUR")
-    logger.info(f"[Market Data] Rent range for comparable properties: {min([c['rent'] for c in comparables])} - {max([c['rent'] for c in comparables])} EUR/month")
+    logger.info("[Market Data] Found %s comparable properties in %s", len(comparables), location)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[Market Data] Price range for comparable properties: %s - %s EUR", min(c['price'] for c in comparables), max(c['price'] for c in comparables))
+        logger.info("[Market Data] Rent range for comparable properties: %s - %s EUR/month", min(c['rent'] for c in comparables), max(c['rent'] for c in comparables))
     
-    return json.dumps({"comparables": comparables})
+    return _to_json({"comparables": comparables})
 
 @function_tool
 def analyze_comparables(property_data: str, comparables: str) -> str:
@@ -224,8 +233,8 @@ def analyze_comparables(property_data: str, comparables: str) -> str:
     logger.info("Analyzing comparable properties")
     
     try:
-        prop = json.loads(property_data)
-        comps = json.loads(comparables)
+        prop = orjson.loads(property_data)
+        comps = orjson.loads(comparables)
         
         # This would contain more complex analysis logic in production
         analysis = {
@@ -246,10 +255,10 @@ def analyze_comparables(property_data: str, comparables: str) -> str:
             }
         }
         
-        return json.dumps(analysis)
+        return _to_json(analysis)
     except Exception as e:
-        logger.error(f"Error analyzing comparables: {str(e)}")
-        return json.dumps({"error": str(e)})
+        logger.error("Error analyzing comparables: %s", e)
+        return _to_json({"error": str(e)})
 
 @function_tool
 def parse_property_text(description: str) -> str:
@@ -286,7 +295,7 @@ def parse_property_text(description: str) -> str:
         }
     }
     
-    return json.dumps(extracted)
+    return _to_json(extracted)
 
 @function_tool
 def analyze_investment_efficiency(property_data: str) -> str:
@@ -302,7 +311,7 @@ def analyze_investment_efficiency(property_data: str) -> str:
     logger.info("Analyzing investment efficiency")
     
     try:
-        data = json.loads(property_data)
+        data = orjson.loads(property_data)
         
         # In production, this would contain complex investment analysis
         analysis = {
@@ -325,10 +334,10 @@ def analyze_investment_efficiency(property_data: str) -> str:
             ]
         }
         
-        return json.dumps(analysis)
+        return _to_json(analysis)
     except Exception as e:
-        logger.error(f"Error analyzing investment efficiency: {str(e)}")
-        return json.dumps({"error": str(e)})
+        logger.error("Error analyzing investment efficiency: %s", e)
+        return _to_json({"error": str(e)})
 
 @function_tool
 def simulate_optimizations(property_data: str, potential_changes: str) -> str:
@@ -345,8 +354,8 @@ def simulate_optimizations(property_data: str, potential_changes: str) -> str:
     logger.info("Simulating optimization impact")
     
     try:
-        prop = json.loads(property_data)
-        changes = json.loads(potential_changes)
+        prop = orjson.loads(property_data)
+        changes = orjson.loads(potential_changes)
         
         # In production, this would run financial simulations
         results = {
@@ -381,10 +390,10 @@ def simulate_optimizations(property_data: str, potential_changes: str) -> str:
             ]
         }
         
-        return json.dumps(results)
+        return _to_json(results)
     except Exception as e:
-        logger.error(f"Error simulating optimizations: {str(e)}")
-        return json.dumps({"error": str(e)})
+        logger.error("Error simulating optimizations: %s", e)
+        return _to_json({"error": str(e)})
 
 @function_tool
 def extract_document_text(file_content: str) -> str:
@@ -422,25 +431,42 @@ def classify_document_type(text: str) -> str:
     logger.info("Classifying document type")
     
     # In production, this would use an LLM or classifier
+    doc_type, confidence = _classify_text(text)
     
-    if "lease" in text.lower() and "rent" in text.lower():
-        doc_type = "lease_agreement"
-        confidence = 0.92
-    elif "inspection" in text.lower():
-        doc_type = "inspection_report"
-        confidence = 0.85
-    elif "title" in text.lower() or "deed" in text.lower():
-        doc_type = "title_deed"
-        confidence = 0.88
-    else:
-        doc_type = "other"
-        confidence = 0.60
-    
-    return json.dumps({
+    return _to_json({
         "document_type": doc_type,
         "confidence": confidence
     })
 
+def _classify_text(text: str) -> Tuple[str, float]:
+    """
+    Keyword-based document classification, cached so repeat documents skip the scan.
+    
+    Args:
+        text: Extracted text from the document
+        
+    Returns:
+        Tuple of (document type, confidence)
+    """
+    cache_key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    cached = _classification_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    text_lower = text.lower()
+    
+    if "lease" in text_lower and "rent" in text_lower:
+        classification = ("lease_agreement", 0.92)
+    elif "inspection" in text_lower:
+        classification = ("inspection_report", 0.85)
+    elif "title" in text_lower or "deed" in text_lower:
+        classification = ("title_deed", 0.88)
+    else:
+        classification = ("other", 0.60)
+    
+    _classification_cache.set(cache_key, classification)
+    return classification
+
 @function_tool
 def monitor_tax_sources(region: str) -> str:
     """
@@ -452,7 +478,7 @@ def monitor_tax_sources(region: str) -> str:
     Returns:
         JSON string with latest tax regulation information
     """
-    logger.info(f"Monitoring tax sources for {region}")
+    logger.info("Monitoring tax sources for %s", region)
     
     # In production, this would scrape government websites
     
@@ -471,7 +497,7 @@ def monitor_tax_sources(region: str) -> str:
         "source": "official-tax-authority.example.gov"
     }
     
-    return json.dumps(regulations)
+    return _to_json(regulations)
 
 @function_tool
 def gather_historical_data(location: str, timeframe: str) -> str:
@@ -485,20 +511,20 @@ def gather_historical_data(location: str, timeframe: str) -> str:
     Returns:
         JSON string with historical market data
     """
-    logger.info(f"[Market Data] Starting to gather historical data for {location} over {timeframe}")
-    logger.info(f"[Market Data] Accessing historical database for {location} property values and rental rates")
+    logger.info("[Market Data] Starting to gather historical data for %s over %s", location, timeframe)
+    logger.info("[Market Data] Accessing historical database for %s property values and rental rates", location)
     
     # In production, this would query a database or market data API
     
     if timeframe == "5 years":
         years = 5
-        logger.info(f"[Market Data] Retrieving 5-year historical data for {location}")
+        logger.info("[Market Data] Retrieving 5-year historical data for %s", location)
     elif timeframe == "10 years":
         years = 10
-        logger.info(f"[Market Data] Retrieving 10-year historical data for {location}")
+        logger.info("[Market Data] Retrieving 10-year historical data for %s", location)
     else:
         years = 3  # default
-        logger.info(f"[Market Data] Unrecognized timeframe '{timeframe}', defaulting to 3 years of data for {location}")
+        logger.info("[Market Data] Unrecognized timeframe '%s', defaulting to 3 years of data for %s", timeframe, location)
     
     # Generate simulated historical data
     current_year = 2025
@@ -506,7 +532,7 @@ def gather_historical_data(location: str, timeframe: str) -> str:
     base_price = 4000  # EUR per sqm
     base_rent = 20  # EUR per sqm
     
-    logger.info(f"[Market Data] Calculating historical trends for {location} from {current_year-years+1} to {current_year}")
+    logger.info("[Market Data] Calculating historical trends for %s from %s to %s", location, current_year-years+1, current_year)
     
     for i in range(years):
         year = current_year - i
@@ -525,17 +551,17 @@ def gather_historical_data(location: str, timeframe: str) -> str:
             "source": "historical-db.example.com"
         })
         
-        logger.info(f"[Market Data] {year} data: price={price_value} EUR/sqm, rent={rent_value} EUR/sqm, vacancy={vacancy_rate}%")
+        logger.info("[Market Data] %s data: price=%s EUR/sqm, rent=%s EUR/sqm, vacancy=%s%%", year, price_value, rent_value, vacancy_rate)
     
     earliest_year = current_year - years + 1
     price_change = round(((history[0]["average_price_sqm"] / history[-1]["average_price_sqm"]) - 1) * 100, 2)
     rent_change = round(((history[0]["average_rent_sqm"] / history[-1]["average_rent_sqm"]) - 1) * 100, 2)
     
-    logger.info(f"[Market Data] Historical analysis complete for {location} from {earliest_year} to {current_year}")
-    logger.info(f"[Market Data] Price appreciation over period: {price_change}%")
-    logger.info(f"[Market Data] Rent appreciation over period: {rent_change}%")
+    logger.info("[Market Data] Historical analysis complete for %s from %s to %s", location, earliest_year, current_year)
+    logger.info("[Market Data] Price appreciation over period: %s%%", price_change)
+    logger.info("[Market Data] Rent appreciation over period: %s%%", rent_change)
     
-    return json.dumps({"location": location, "history": history, "summary": {
+    return _to_json({"location": location, "history": history, "summary": {
         "price_appreciation": price_change,
         "rent_appreciation": rent_change,
         "years": years
@@ -552,12 +578,12 @@ def search_development_news(location: str) -> str:
     Returns:
         JSON string with development news
     """
-    logger.info(f"[Market Data] Starting to search for development news in {location}")
-    logger.info(f"[Market Data] Querying news sources for recent development projects in {location}")
+    logger.info("[Market Data] Starting to search for development news in %s", location)
+    logger.info("[Market Data] Querying news sources for recent development projects in %s", location)
     
     # In production, this would use a news API or web scraping
     
-    logger.info(f"[Market Data] Filtering for recent and relevant development news for {location}")
+    logger.info("[Market Data] Filtering for recent and relevant development news for %s", location)
     
     # Simulate news results
     news = [
@@ -584,11 +610,11 @@ def search_development_news(location: str) -> str:
         }
     ]
     
-    logger.info(f"[Market Data] Found {len(news)} relevant development news items for {location}")
+    logger.info("[Market Data] Found %s relevant development news items for %s", len(news), location)
     
     # Log each news item with impact assessment
     for item in news:
-        logger.info(f"[Market Data] Development news: {item['title']} (Impact: {item['impact']})")
+        logger.info("[Market Data] Development news: %s (Impact: %s)", item['title'], item['impact'])
     
     # Calculate impact statistics
     impact_count = {"positive": 0, "negative": 0, "neutral": 0, "very positive": 0, "very negative": 0}
@@ -596,10 +622,19 @@ def search_development_news(location: str) -> str:
         if item["impact"] in impact_count:
             impact_count[item["impact"]] += 1
     
-    logger.info(f"[Market Data] Development news impact summary for {location}: {impact_count}")
-    logger.info(f"[Market Data] Development news search completed for {location}")
+    logger.info("[Market Data] Development news impact summary for %s: %s", location, impact_count)
+    logger.info("[Market Data] Development news search completed for %s", location)
     
-    return json.dumps({"location": location, "news": news, "impact_summary": impact_count})
+    return _to_json({"location": location, "news": news, "impact_summary": impact_count})
+
+# Canned explanations by section type and complexity level
+SECTION_EXPLANATIONS = {
+    "cash_flow": {
+        "simple": "This property generates €500 in monthly cash flow after all expenses. This is considered good for a property of this size and location.",
+        "detailed": "Your property generates a monthly cash flow of €500 after accounting for all expenses including mortgage, property taxes, insurance, and maintenance reserves. This represents a cash-on-cash return of 5.8% annually, which is 1.2% above the neighborhood average for similar properties.",
+        "expert": "The subject property produces €500 in monthly cash flow with a detailed expense ratio of 38% (below the 42% market average). The debt service coverage ratio is 1.35, indicating strong ability to service the debt from rental income. The cash-on-cash return of 5.8% positions this investment in the top quartile for this asset class in the target area.",
+    },
+}
 
 @function_tool
 def generate_section_explanation(data: str, complexity_level: str) -> str:
@@ -613,26 +648,22 @@ def generate_section_explanation(data: str, complexity_level: str) -> str:
     Returns:
         Natural language explanation
     """
-    logger.info(f"[Market Data] Generating explanation at {complexity_level} level")
+    logger.info("[Market Data] Generating explanation at %s level", complexity_level)
     
     try:
-        section_data = json.loads(data)
+        section_data = orjson.loads(data)
         section_type = section_data.get("section_type", "")
         
         # In production, this would use an LLM to generate natural language explanations
-        
-        if section_type == "cash_flow":
-            if complexity_level == "simple":
-                explanation = "This property generates €500 in monthly cash flow after all expenses. This is considered good for a property of this size and location."
-            elif complexity_level == "detailed":
-                explanation = "Your property generates a monthly cash flow of €500 after accounting for all expenses including mortgage, property taxes, insurance, and maintenance reserves. This represents a cash-on-cash return of 5.8% annually, which is 1.2% above the neighborhood average for similar properties."
-            else:  # expert
-                explanation = "The subject property produces €500 in monthly cash flow with a detailed expense ratio of 38% (below the 42% market average). The debt service coverage ratio is 1.35, indicating strong ability to service the debt from rental income. The cash-on-cash return of 5.8% positions this investment in the top quartile for this asset class in the target area."
+        level_explanations = SECTION_EXPLANATIONS.get(section_type)
+        if level_explanations:
+            # Unknown complexity levels fall back to the expert explanation
+            explanation = level_explanations.get(complexity_level, level_explanations["expert"])
         else:
             explanation = f"Explanation for {section_type} at {complexity_level} level would be generated here."
         
-        logger.info(f"[Market Data] Generated a {len(explanation)} character explanation for {section_type}")
+        logger.info("[Market Data] Generated a %s character explanation for %s", len(explanation), section_type)
         return explanation
     except Exception as e:
-        logger.error(f"[Market Data] Error generating explanation: {str(e)}")
+        logger.error("[Market Data] Error generating explanation: %s", e)
         return f"Unable to generate explanation due to an error: {str(e)}"
\ No newline at end of file
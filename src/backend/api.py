@@ -12,13 +12,18 @@ import asyncio
 import json
 from datetime import datetime
 
-from ..database.database import get_db
-from ..database.models import User, Property, RentalUnit, Expense, Financing, Analysis
-from ..ai_agents.orchestrator import orchestrator
-from ..ai_agents import AIAgentSystem
-from ..utils.financial_utils import analyze_property_investment 
+# Configure logging once for the application entry point, before the package
+# imports below so their import-time messages are not dropped
+logging.basicConfig(level=logging.INFO)
+
+from ..database.database import get_db  # noqa: E402
+from ..database.models import (  # noqa: E402
+    User, Property, RentalUnit, Expense, Financing, Analysis
+)
+from ..ai_agents.orchestrator import orchestrator  # noqa: E402
+from ..ai_agents import AIAgentSystem  # noqa: E402
+from ..utils.financial_utils import analyze_property_investment  # noqa: E402
 
-# Configure logging
 logger = logging.getLogger(__name__)
 
 # AI agent system instance
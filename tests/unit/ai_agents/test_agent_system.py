@@ -57,12 +57,12 @@ class SimplifiedAIAgentTests(AsyncTestCase):
         "AZURE_OPENAI_ENDPOINT": "https://test.openai.azure.com",
         "OPENAI_API_VERSION": "2023-05-15"
     })
-    @patch("src.ai_agents.agent_system.AsyncAzureOpenAI")
-    def test_init_azure(self, mock_azure):
+    @patch("src.ai_agents.agent_system.get_openai_client")
+    def test_init_azure(self, mock_get_client):
         """Test initializing with Azure OpenAI (with patched Azure client)"""
-        # Mock the Azure client to prevent actual API calls
+        # Mock the shared Azure client to prevent actual API calls
         mock_client = MagicMock()
-        mock_azure.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         # Create system with Azure config
         system = AIAgentSystem(
@@ -75,6 +75,7 @@ class SimplifiedAIAgentTests(AsyncTestCase):
         self.assertTrue(system.use_azure)
         self.assertEqual(system.azure_deployment, "test-deployment")
         self.assertEqual(system.azure_endpoint, "https://test.openai.azure.com")
+        mock_get_client.assert_called_once_with()
 
 
 # Specialized agent factory tests with minimal dependencies
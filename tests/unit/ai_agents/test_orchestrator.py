@@ -0,0 +1,153 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.ai_agents.orchestrator import AgentOrchestrator
+from src.ai_agents.orchestrator.orchestrator import gather_bounded
+
+
+class AsyncTestCase(unittest.TestCase):
+    """Base class for async tests"""
+    
+    def run_async(self, coro):
+        """Helper method to run coroutines in tests"""
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def make_agent(name="Rent Estimation Agent"):
+    """Create a mock agent that can be registered with the orchestrator"""
+    agent = MagicMock()
+    agent.name = name
+    agent.tools = []
+    return agent
+
+
+@patch("src.ai_agents.orchestrator.orchestrator.Runner")
+class ExecuteTaskCacheTests(AsyncTestCase):
+    """Tests for the response cache in AgentOrchestrator.execute_task"""
+    
+    def setUp(self):
+        self.orchestrator = AgentOrchestrator()
+        self.orchestrator.register_specialized_agent("rent_estimation", make_agent())
+    
+    def test_identical_task_is_answered_from_cache(self, mock_runner):
+        """Test that a repeated task does not call the model again"""
+        mock_runner.run = AsyncMock(return_value=MagicMock(final_output={"rent": 1500}))
+        
+        first = self.run_async(self.orchestrator.execute_task("rent_estimation", "Estimate rent"))
+        second = self.run_async(self.orchestrator.execute_task("rent_estimation", "Estimate rent"))
+        
+        self.assertEqual(mock_runner.run.await_count, 1)
+        self.assertEqual(second.status, "success")
+        self.assertEqual(second.content, first.content)
+        self.assertNotEqual(second.task_id, first.task_id)
+    
+    def test_different_parameters_are_not_shared(self, mock_runner):
+        """Test that the same input with different parameters runs the agent again"""
+        mock_runner.run = AsyncMock(return_value=MagicMock(final_output="answer"))
+        
+        self.run_async(self.orchestrator.execute_task("rent_estimation", "Estimate rent", location="Berlin"))
+        self.run_async(self.orchestrator.execute_task("rent_estimation", "Estimate rent", location="Munich"))
+        
+        self.assertEqual(mock_runner.run.await_count, 2)
+    
+    def test_hit_returns_independent_copy(self, mock_runner):
+        """Test that modifying a returned output does not change later hits"""
+        mock_runner.run = AsyncMock(return_value=MagicMock(final_output={"key_factors": ["size"]}))
+        
+        first = self.run_async(self.orchestrator.execute_task("rent_estimation", "Estimate rent"))
+        first.content["final_output"]["key_factors"].append("changed")
+        second = self.run_async(self.orchestrator.execute_task("rent_estimation", "Estimate rent"))
+        
+        self.assertEqual(second.content["final_output"], {"key_factors": ["size"]})
+    
+    def test_failed_run_is_not_cached(self, mock_runner):
+        """Test that a failing run is retried instead of served from the cache"""
+        mock_runner.run = AsyncMock(side_effect=[RuntimeError("rate limited"), MagicMock(final_output="answer")])
+        
+        first = self.run_async(self.orchestrator.execute_task("rent_estimation", "Estimate rent"))
+        second = self.run_async(self.orchestrator.execute_task("rent_estimation", "Estimate rent"))
+        
+        self.assertEqual(first.status, "failure")
+        self.assertEqual(second.status, "success")
+        self.assertEqual(mock_runner.run.await_count, 2)
+
+
+
+class ConcurrencyTracker:
+    """Stand-in for Runner.run that records peak concurrency"""
+    
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.active = 0
+        self.peak = 0
+    
+    async def __call__(self, agent, input_text, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if input_text == self.fail_on:
+                raise ValueError(f"bad input {input_text}")
+            return MagicMock(final_output=input_text.upper())
+        finally:
+            self.active -= 1
+
+
+class GatherBoundedTests(AsyncTestCase):
+    """Tests for the gather_bounded helper"""
+    
+    def test_results_keep_order_and_respect_limit(self):
+        """Test that results line up with inputs and concurrency stays bounded"""
+        tracker = ConcurrencyTracker()
+        inputs = [f"input-{i}" for i in range(12)]
+        
+        results = self.run_async(gather_bounded((tracker(None, text) for text in inputs), max_concurrency=3))
+        
+        self.assertEqual([result.final_output for result in results], [text.upper() for text in inputs])
+        self.assertLessEqual(tracker.peak, 3)
+        self.assertGreater(tracker.peak, 1)
+
+
+@patch("src.ai_agents.orchestrator.orchestrator.Runner")
+class ExecuteTasksTests(AsyncTestCase):
+    """Tests for AgentOrchestrator.execute_tasks"""
+    
+    def setUp(self):
+        self.orchestrator = AgentOrchestrator()
+        self.orchestrator.register_specialized_agent("rent_estimation", make_agent())
+    
+    def test_results_keep_input_order(self, mock_runner):
+        """Test that task results line up with the inputs"""
+        mock_runner.run = ConcurrencyTracker()
+        inputs = [f"property-{i}" for i in range(10)]
+        
+        results = self.run_async(self.orchestrator.execute_tasks("rent_estimation", inputs))
+        
+        self.assertEqual([result.content["final_output"] for result in results], [text.upper() for text in inputs])
+    
+    def test_concurrency_stays_within_limit(self, mock_runner):
+        """Test that no more than max_concurrency agent runs are in flight"""
+        tracker = ConcurrencyTracker()
+        mock_runner.run = tracker
+        inputs = [f"property-{i}" for i in range(12)]
+        
+        self.run_async(self.orchestrator.execute_tasks("rent_estimation", inputs, max_concurrency=3))
+        
+        self.assertLessEqual(tracker.peak, 3)
+        self.assertGreater(tracker.peak, 1)
+    
+    def test_failing_input_does_not_lose_other_results(self, mock_runner):
+        """Test that one failing input yields a failed result in its own slot only"""
+        mock_runner.run = ConcurrencyTracker(fail_on="property-1")
+        
+        results = self.run_async(self.orchestrator.execute_tasks(
+            "rent_estimation", ["property-0", "property-1", "property-2"]
+        ))
+        
+        self.assertEqual([result.status for result in results], ["success", "failure", "success"])
+        self.assertEqual(results[2].content["final_output"], "PROPERTY-2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import patch
+
+from src.ai_agents.cache import ResponseCache, make_cache_key
+
+
+class MakeCacheKeyTests(unittest.TestCase):
+    """Tests for cache key canonicalization"""
+    
+    def test_key_ignores_dict_ordering(self):
+        """Test that equivalent dicts produce the same key"""
+        key_a = make_cache_key("lease_agreement", {"a": 1, "b": 2})
+        key_b = make_cache_key("lease_agreement", {"b": 2, "a": 1})
+        self.assertEqual(key_a, key_b)
+    
+    def test_key_distinguishes_inputs(self):
+        """Test that different inputs produce different keys"""
+        self.assertNotEqual(
+            make_cache_key("lease_agreement", "text", None),
+            make_cache_key("lease_agreement", "text", ["rent"])
+        )
+
+
+class ResponseCacheTests(unittest.TestCase):
+    """Tests for the bounded response cache"""
+    
+    def test_get_returns_stored_value(self):
+        """Test a simple set/get round trip"""
+        cache = ResponseCache(maxsize=2)
+        cache.set("key", {"value": 1})
+        self.assertEqual(cache.get("key"), {"value": 1})
+        self.assertIsNone(cache.get("missing"))
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is evicted when full"""
+        cache = ResponseCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+    
+    @patch("src.ai_agents.cache.response_cache.time.monotonic")
+    def test_expired_entries_are_dropped(self, mock_monotonic):
+        """Test that entries older than the TTL are treated as misses"""
+        cache = ResponseCache(maxsize=2, ttl=10)
+        mock_monotonic.return_value = 100.0
+        cache.set("key", "value")
+        
+        mock_monotonic.return_value = 105.0
+        self.assertEqual(cache.get("key"), "value")
+        
+        mock_monotonic.return_value = 111.0
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
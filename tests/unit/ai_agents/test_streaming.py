@@ -0,0 +1,122 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.ai_agents.agent_system import AIAgentSystem
+from src.ai_agents.orchestrator import AgentOrchestrator
+
+
+class FakeTextDelta:
+    """Stand-in for ResponseTextDeltaEvent"""
+
+    def __init__(self, delta):
+        self.delta = delta
+
+
+class FakeStreamedResult:
+    """Stand-in for the result of Runner.run_streamed"""
+
+    def __init__(self, events, error=None):
+        self.events = events
+        self.error = error
+
+    async def stream_events(self):
+        for event in self.events:
+            yield event
+        if self.error:
+            raise self.error
+
+
+def text_event(delta):
+    return SimpleNamespace(type="raw_response_event", data=FakeTextDelta(delta))
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class AsyncTestCase(unittest.TestCase):
+    """Base class for async tests"""
+
+    def run_async(self, coro):
+        """Helper method to run coroutines in tests"""
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+
+@patch("src.ai_agents.orchestrator.orchestrator.ResponseTextDeltaEvent", FakeTextDelta)
+@patch("src.ai_agents.orchestrator.orchestrator.Runner")
+class StreamTaskTests(AsyncTestCase):
+    """Tests for AgentOrchestrator.stream_task with a mocked Runner.run_streamed"""
+
+    def setUp(self):
+        self.orchestrator = AgentOrchestrator()
+        agent = MagicMock()
+        agent.name = "Rent Estimation Agent"
+        agent.tools = []
+        self.orchestrator.register_specialized_agent("rent_estimation", agent)
+
+    def test_yields_text_deltas_only(self, mock_runner):
+        """Test that only text delta events are forwarded, in order"""
+        mock_runner.run_streamed.return_value = FakeStreamedResult([
+            text_event("Estimated "),
+            SimpleNamespace(type="run_item_stream_event", data=None),
+            text_event("rent: 1500"),
+        ])
+
+        chunks = self.run_async(collect(self.orchestrator.stream_task("rent_estimation", "Estimate rent")))
+
+        self.assertEqual(chunks, ["Estimated ", "rent: 1500"])
+
+    def test_unknown_agent_raises_value_error(self, mock_runner):
+        """Test that an unknown agent type is rejected before streaming"""
+        with self.assertRaises(ValueError):
+            self.run_async(collect(self.orchestrator.stream_task("unknown", "Estimate rent")))
+
+        mock_runner.run_streamed.assert_not_called()
+
+    def test_mid_stream_error_is_logged_and_wrapped(self, mock_runner):
+        """Test that a failure during streaming is logged and raised as RuntimeError"""
+        error = ConnectionError("stream dropped")
+        mock_runner.run_streamed.return_value = FakeStreamedResult([text_event("Estimated ")], error=error)
+        chunks = []
+
+        async def consume():
+            async for chunk in self.orchestrator.stream_task("rent_estimation", "Estimate rent"):
+                chunks.append(chunk)
+
+        with self.assertLogs("src.ai_agents.orchestrator.orchestrator", level="ERROR"):
+            with self.assertRaises(RuntimeError) as context:
+                self.run_async(consume())
+
+        self.assertEqual(chunks, ["Estimated "])
+        self.assertIs(context.exception.__cause__, error)
+
+
+class StreamDirectTaskTests(AsyncTestCase):
+    """Tests for AIAgentSystem.stream_direct_task"""
+
+    def test_requires_initialization(self):
+        """Test that streaming before initialize() raises ValueError"""
+        system = AIAgentSystem(model_name="gpt-4o")
+
+        with self.assertRaises(ValueError):
+            self.run_async(collect(system.stream_direct_task("rent_estimation", "Estimate rent")))
+
+    def test_forwards_orchestrator_chunks(self):
+        """Test that chunks from the orchestrator are passed through unchanged"""
+        async def fake_stream(agent_type, input_text):
+            yield "Estimated "
+            yield "rent: 1500"
+
+        system = AIAgentSystem(model_name="gpt-4o")
+        system.orchestrator = MagicMock()
+        system.orchestrator.stream_task = fake_stream
+
+        chunks = self.run_async(collect(system.stream_direct_task("rent_estimation", "Estimate rent")))
+
+        self.assertEqual(chunks, ["Estimated ", "rent: 1500"])
+
+
+if __name__ == "__main__":
+    unittest.main()